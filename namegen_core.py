@@ -0,0 +1,269 @@
+"""
+Pure name-generation logic, kept free of Streamlit so it can be imported cheaply and
+compiled ahead of time:
+
+    pip install mypy && mypyc namegen_core.py
+
+That drops a namegen_core.*.so next to this file, which Python's import system prefers
+over the .py. Without a build (or with one for another interpreter) the .py is used.
+"""
+import random
+import re
+import string
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+
+_SPLIT_RE = re.compile(r"[\n,]+")
+_KEEP = frozenset(string.ascii_letters + " -'")
+# str.translate table deleting every ASCII char outside _KEEP (non-ASCII words take the slow path)
+_DROP_DISALLOWED: Dict[int, None] = {i: None for i in range(128) if chr(i) not in _KEEP}
+
+
+def normalize_words(text: str) -> List[str]:
+    # dedupe while keeping order (first spelling wins)
+    out: Dict[str, str] = {}
+    for w in _SPLIT_RE.split(text):
+        w = w.strip()
+        if not w:
+            continue
+        if w.isascii():
+            w = w.translate(_DROP_DISALLOWED).strip()
+        else:
+            w = "".join(c for c in w if c in _KEEP).strip()
+        if w:
+            out.setdefault(w.lower(), w)
+    return list(out.values())
+
+
+# -----------------------------
+# Generator logic
+# -----------------------------
+def apply_case(s: str, mode: str) -> str:
+    if mode == "Title Case":
+        return s.title()
+    if mode == "UPPER":
+        return s.upper()
+    if mode == "lower":
+        return s.lower()
+    return s
+
+
+_SEP_FMT: Dict[str, str] = {
+    "Space": "{} {}",
+    "Hyphen": "{}-{}",
+    "Underscore": "{}_{}",
+    "of": "{} of {}",
+}
+
+
+def join_name(adj: str, noun: str, separator: str) -> str:
+    return _SEP_FMT.get(separator, "{} {}").format(adj, noun)
+
+
+class AliasSampler:
+    """
+    Weighted sampling with replacement via Vose's alias method:
+    O(n) setup, then O(1) per draw (one randrange + one coin flip).
+    """
+
+    def __init__(self, items: List[Tuple[str, str]], weights: Sequence[float]):
+        self.items = list(items)
+        n = len(self.items)
+        self.prob: List[float] = [1.0] * n
+        self.alias = list(range(n))
+
+        total = float(sum(weights))
+        if n == 0 or total <= 0:
+            self.items = []
+            return
+
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] = scaled[l] + scaled[s] - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        # leftovers are 1.0 up to float error
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def sample_index(self, rng: random.Random) -> int:
+        i = rng.randrange(len(self.items))
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+    def sample(self, rng: random.Random) -> Tuple[str, str]:
+        return self.items[self.sample_index(rng)]
+
+
+def build_tier_sampler(lists: Dict[str, List[str]], tier_weights: Dict[str, int]) -> AliasSampler:
+    """
+    One flat (tier, word) pool. Each word gets tier_weight / len(tier), so a single
+    draw keeps tier odds set by the weights alone (weighted tier, then uniform word).
+    """
+    items: List[Tuple[str, str]] = []
+    weights: List[float] = []
+    for t, w in tier_weights.items():
+        words = lists.get(t, [])
+        if w > 0 and words:
+            share = w / len(words)
+            for word in words:
+                items.append((t, word))
+                weights.append(share)
+    return AliasSampler(items, weights)
+
+
+def cased_words(sampler: AliasSampler, case_mode: str) -> Tuple[str, ...]:
+    """The sampler's words with case_mode applied, index-aligned with sampler.items."""
+    return tuple(apply_case(w, case_mode) for _, w in sampler.items)
+
+
+def _letter_slot(word: str) -> int:
+    """0-25 for a word starting with an ASCII letter, else -1."""
+    c = word[:1]
+    if c.isascii() and c.isalpha():
+        return ord(c.lower()) - 97
+    return -1
+
+
+def build_letter_buckets(noun_sampler: AliasSampler) -> List[Tuple[int, ...]]:
+    """
+    26 buckets (a-z) of indices into noun_sampler.items, for alliteration lookups.
+    Nouns that don't start with an ASCII letter can't alliterate and are left out.
+    """
+    buckets: List[List[int]] = [[] for _ in range(26)]
+    for i, (_, n) in enumerate(noun_sampler.items):
+        slot = _letter_slot(n)
+        if slot >= 0:
+            buckets[slot].append(i)
+    return [tuple(b) for b in buckets]
+
+
+def _first_index_by_word(sampler: AliasSampler) -> Dict[str, int]:
+    first: Dict[str, int] = {}
+    for i, (_, w) in enumerate(sampler.items):
+        first.setdefault(w.lower(), i)
+    return first
+
+
+class NamePools:
+    """Samplers, alliteration buckets and pair ids for one (tier weights, wordlists) snapshot."""
+
+    def __init__(self, adjectives: Dict[str, List[str]], nouns: Dict[str, List[str]], tier_weights: Dict[str, int]):
+        self.adj = build_tier_sampler(adjectives, tier_weights)
+        self.noun = build_tier_sampler(nouns, tier_weights)
+        self.noun_buckets = build_letter_buckets(self.noun)
+
+        self._adj_first = _first_index_by_word(self.adj)
+        self._noun_first = _first_index_by_word(self.noun)
+        self.adj_keys = tuple(self._adj_first[w.lower()] for _, w in self.adj.items)
+        self.noun_keys = tuple(self._noun_first[w.lower()] for _, w in self.noun.items)
+        self.n_nouns = len(self.noun)
+
+        self._cased: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+
+    def cased(self, case_mode: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """(adj_cased, noun_cased), index-aligned with the samplers; built once per mode."""
+        if case_mode not in self._cased:
+            self._cased[case_mode] = (cased_words(self.adj, case_mode), cased_words(self.noun, case_mode))
+        return self._cased[case_mode]
+
+    def pair_id(self, adj_idx: int, noun_idx: int) -> int:
+        return self.adj_keys[adj_idx] * self.n_nouns + self.noun_keys[noun_idx]
+
+    def distinct_pair_ids(self) -> List[int]:
+        return [a * self.n_nouns + n for a in self._adj_first.values() for n in self._noun_first.values()]
+
+    def pair_words(self, pair_id: int) -> Tuple[str, str]:
+        adj_idx, noun_idx = divmod(pair_id, self.n_nouns)
+        return self.adj.items[adj_idx][1].lower(), self.noun.items[noun_idx][1].lower()
+
+    def pair_id_for_words(self, adj_word: str, noun_word: str) -> Optional[int]:
+        adj_idx = self._adj_first.get(adj_word)
+        noun_idx = self._noun_first.get(noun_word)
+        if adj_idx is None or noun_idx is None:
+            return None
+        return adj_idx * self.n_nouns + noun_idx
+
+    def pair_ids_for_words(self, words: Set[Tuple[str, str]]) -> Set[int]:
+        """Pair ids for the (case-folded) word pairs that exist in these pools."""
+        ids: Set[int] = set()
+        for adj_word, noun_word in words:
+            pid = self.pair_id_for_words(adj_word, noun_word)
+            if pid is not None:
+                ids.add(pid)
+        return ids
+
+
+def generate_one_name(
+    pools: NamePools,
+    separator: str,
+    case_mode: str,
+    alliteration: bool,
+    avoid_duplicates: bool,
+    used_pairs: Set[int],
+    rng: random.Random,
+    used_words: Optional[Set[Tuple[str, str]]] = None,
+) -> Optional[Tuple[str, str, str, str, str]]:
+    """
+    Returns (final_name, adj, noun, adj_tier, noun_tier) or None.
+    Accepted pairs go into used_pairs and, as case-folded words, into used_words.
+    """
+
+    adj_sampler, noun_sampler = pools.adj, pools.noun
+    if not adj_sampler or (not alliteration and not noun_sampler):
+        return None
+
+    noun_buckets = pools.noun_buckets
+    adj_cased, noun_cased = pools.cased(case_mode)
+    n_nouns = pools.n_nouns
+
+    # Once most pairs are taken, rejection sampling mostly misses, so draw
+    # uniformly from the pairs that are still free instead.
+    live: Optional[List[int]] = None
+    if avoid_duplicates and not alliteration and len(used_pairs) * 2 > len(adj_sampler) * n_nouns:
+        live = [pid for pid in pools.distinct_pair_ids() if pid not in used_pairs]
+
+    tries = 0
+    while tries < 250:
+        tries += 1
+
+        if live is not None:
+            if not live:
+                return None
+            j = rng.randrange(len(live))
+            pair_id = live[j]
+            live[j] = live[-1]
+            live.pop()
+            adj_idx, noun_idx = divmod(pair_id, n_nouns)
+        else:
+            adj_idx = adj_sampler.sample_index(rng)
+            if alliteration:
+                slot = _letter_slot(adj_sampler.items[adj_idx][1])
+                if slot < 0:
+                    continue
+                bucket = noun_buckets[slot]
+                if not bucket:
+                    continue
+                noun_idx = bucket[rng.randrange(len(bucket))]
+            else:
+                noun_idx = noun_sampler.sample_index(rng)
+            pair_id = pools.pair_id(adj_idx, noun_idx)
+            if avoid_duplicates and pair_id in used_pairs:
+                continue
+
+        # only an accepted pair gets turned into a string
+        if avoid_duplicates:
+            used_pairs.add(pair_id)
+            if used_words is not None:
+                used_words.add(pools.pair_words(pair_id))
+        adj, noun = adj_cased[adj_idx], noun_cased[noun_idx]
+        final_name = join_name(adj, noun, separator)
+        return final_name, adj, noun, adj_sampler.items[adj_idx][0], noun_sampler.items[noun_idx][0]
+
+    return None